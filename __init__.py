@@ -25,4 +25,4 @@ __author__ = "GitHub Copilot"
 from .calculator import calculate_index, calc_contribution
 from .storage import save_all_data, load_history_data
 from .visualizer import generate_all_charts
-from .crawler import configure_api_settings, get_api_troubleshooting_info, SecurityControlException
\ No newline at end of file
+from .crawler import configure_browser, get_troubleshooting
\ No newline at end of file
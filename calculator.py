@@ -16,12 +16,10 @@ def calculate_index(videos):
     """
     from config import VIEW_DIVISOR, COMMENT_DIVISOR
     
-    total = 0.0
-    for v in videos:
-        # 单个视频指数 = (播放量/10000 + 评论数/100)
-        video_index = (v["view"] / VIEW_DIVISOR) + (v["comment"] / COMMENT_DIVISOR)
-        total += video_index
-    return total  # 无视频时自动返回0.0
+    # 单个视频指数 = (播放量/10000 + 评论数/100)，求和可先对整数累加再各除一次
+    total_views = sum(v["view"] for v in videos)
+    total_comments = sum(v["comment"] for v in videos)
+    return total_views / VIEW_DIVISOR + total_comments / COMMENT_DIVISOR  # 无视频时返回0.0
 
 
 def calc_contribution(video):
@@ -35,17 +33,23 @@ def calc_contribution(video):
     return (video["view"] / VIEW_DIVISOR) + (video["comment"] / COMMENT_DIVISOR)
 
 
+def iter_video_details(videos):
+    """
+    逐个生成视频详细信息，包括每个视频的贡献值 (不构建中间列表)
+    :param videos: 视频列表
+    :return: 包含贡献值的视频详细信息生成器
+    """
+    for video in videos:
+        yield {
+            **video,
+            "contribution": calc_contribution(video)
+        }
+
+
 def get_video_details(videos):
     """
     获取视频详细信息，包括每个视频的贡献值
     :param videos: 视频列表
     :return: 包含贡献值的视频详细信息列表
     """
-    detailed_videos = []
-    for video in videos:
-        contribution = calc_contribution(video)
-        detailed_videos.append({
-            **video,
-            "contribution": contribution
-        })
-    return detailed_videos
\ No newline at end of file
+    return list(iter_video_details(videos))
\ No newline at end of file
@@ -39,6 +39,12 @@ BROWSER_CONFIG = {
     "retry_attempts": 3,         # 重试次数
     "retry_delay": 2,            # 重试延迟(秒)
     "page_delay": 1,             # 页面间隔(秒)
+    "page_concurrency": 4,       # 并发加载的分页数 (同一浏览器上下文内的标签页数)
+    "cache_ttl": 600,            # 视频结果缓存有效期(秒)，0表示不缓存
+    "page_cache_ttl": 60,        # 分页HTML缓存有效期(秒)，重试时复用已下载的页面，0表示不缓存
+    "page_cache_size": 256,      # 分页HTML缓存最多保留的页面数
+    "page_disk_cache_dir": None, # 分页HTML磁盘缓存目录 (按UID/页码/日期保存gzip文件，当天重复运行免下载)，None表示不启用
+    "blocked_resource_types": ["image", "media", "font", "stylesheet"],  # 拦截不需要的资源类型，空列表表示不拦截
 }
 
 # 时间配置 - 性能优化：减少等待时间提升爬取速度
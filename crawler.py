@@ -16,17 +16,74 @@ import logging
 import time
 import re
 import traceback
+import gzip
+import pathlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from operator import itemgetter
 from config import BROWSER_CONFIG, ERROR_MESSAGES, TIMING_CONFIG, DEBUG_CONFIG
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
     logging.warning("BeautifulSoup4 not available, HTML parsing will be limited")
 
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    logging.warning("lxml not available, falling back to html.parser (slower): pip install lxml")
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTML解析器: 优先使用C实现的lxml
+_HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# 页面内嵌的初始状态JSON (命中时无需构建DOM)
+_INITIAL_STATE_RE = re.compile(r'window\.__INITIAL_STATE__\s*=\s*(\{.*?\});\s*\(function', re.DOTALL)
+
+# __INITIAL_STATE__ 视频列表条目中用到的字段
+_VLIST_KEYS = ('aid', 'play', 'comment', 'title', 'created')
+_VLIST_FIELDS = itemgetter(*_VLIST_KEYS)
+
+# 视频链接中的AV号/BV号
+_AV_RE = re.compile(r'/video/av(\d+)')
+_BV_RE = re.compile(r'/video/(BV\w+)')
+
+# 发布时间文本特征: 绝对日期年份或相对时间
+_TIME_HINT_RE = re.compile(r'20\d\d|小时前|分钟前|天前')
+_RELATIVE_TIME_RE = re.compile(r'小时前|分钟前|天前|个月前|年前')
+
+# BV号转AV号所用的编码表与常量
+_BV_TABLE = {char: index for index, char in enumerate("FcwAPNKTMug3GV5Lj7EJnHpWsx4tb8haYeviqBz6rkCy12mUSDQX9RdoZf")}
+_BV_XOR_CODE = 23442827791579
+_BV_MASK_CODE = 2251799813685247
+
+# 统计数字解析：数字主体 + 可选的中文单位
+_STATS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([万千百亿])?')
+_STATS_UNITS = {'万': 10000, '千': 1000, '百': 100, '亿': 100000000, None: 1}
+
+# 标题中的播放量模式，如 "4.0万", "3.7万", "32万" 等: (模式, 倍数)
+_VIEW_COUNT_PATTERNS = [
+    (re.compile(r'(\d+\.?\d*)万'), 10000),      # X.X万 or X万
+    (re.compile(r'(\d+\.?\d*)千'), 1000),       # X.X千 or X千
+    (re.compile(r'(\d+\.?\d*)亿'), 100000000),  # X.X亿 or X亿
+    (re.compile(r'(\d+\.?\d*)百'), 100),        # X.X百 or X百
+]
+
+# 只构建视频列表所在的div/script子树，跳过head、样式和内联SVG等无关节点
+_PARSE_ONLY = SoupStrainer(['script', 'div']) if BS4_AVAILABLE else None
+
 try:
     from playwright.async_api import async_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -36,6 +93,97 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 视频结果缓存: {(uid, start_date, end_date, extended_pages): (过期时间, 视频列表)}
+_VIDEO_CACHE = {}
+_VIDEO_CACHE_LOCKS = {}
+
+# 分页HTML缓存: {(uid, page_num): (过期时间, HTML内容)}，按插入顺序淘汰
+_PAGE_CACHE = {}
+
+# 视频卡片中的首个视频链接 (用于翻页后检测内容是否刷新)
+_FIRST_VIDEO_HREF_JS = """
+    () => {
+        const link = document.querySelector('.bili-video-card a[href*="/video/"], .small-item a[href*="/video/"]');
+        return link ? link.getAttribute('href') : null;
+    }
+"""
+
+_VIDEO_LIST_CHANGED_JS = """
+    (previousHref) => {
+        const link = document.querySelector('.bili-video-card a[href*="/video/"], .small-item a[href*="/video/"]');
+        return link !== null && link.getAttribute('href') !== previousHref;
+    }
+"""
+
+# 浏览器上下文的请求头
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+_EXTRA_HTTP_HEADERS = {
+    'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+}
+
+# 反检测脚本 (Chromium通过启动参数屏蔽navigator.webdriver，其他浏览器额外注入覆盖脚本)
+_WEBDRIVER_STEALTH_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+"""
+
+_STEALTH_JS = """
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+    
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['zh-CN', 'zh', 'en'],
+    });
+    
+    window.chrome = {
+        runtime: {},
+    };
+    
+    Object.defineProperty(navigator, 'permissions', {
+        get: () => ({
+            query: () => Promise.resolve({ state: 'granted' }),
+        }),
+    });
+"""
+
+
+@lru_cache(maxsize=4096)
+def _pubdate(timestamp):
+    """将发布时间戳转换为本地日期字符串 (YYYY-MM-DD)"""
+    return datetime.date.fromtimestamp(timestamp).isoformat()
+
+
+def _bv2av(bv_id):
+    """将BV号解码为AV号，BV号格式无效时返回0"""
+    if len(bv_id) != 12:
+        return 0
+    chars = list(bv_id)
+    chars[3], chars[9] = chars[9], chars[3]
+    chars[4], chars[7] = chars[7], chars[4]
+    
+    value = 0
+    for char in chars[3:]:
+        index = _BV_TABLE.get(char)
+        if index is None:
+            return 0
+        value = value * 58 + index
+    return (value & _BV_MASK_CODE) ^ _BV_XOR_CODE
+
+
+@lru_cache(maxsize=4096)
+def _parse_stats_number(text):
+    """解析统计数字，支持中文数字格式 (同样的"1.2万"在各页反复出现，结果缓存)"""
+    if not text:
+        return 0
+        
+    match = _STATS_RE.search(text.replace(',', ''))
+    if not match:
+        return 0
+    return int(float(match.group(1)) * _STATS_UNITS[match.group(2)])
+
 
 def enable_debug():
     """启用调试模式"""
@@ -47,9 +195,15 @@ def enable_debug():
     log_config()
 
 
+def _debug_enabled(option):
+    """调试模式及对应的日志项均已开启，且logger会实际输出DEBUG级别日志"""
+    return (DEBUG_CONFIG.get("enabled", False) and DEBUG_CONFIG.get(option, False)
+            and logger.isEnabledFor(logging.DEBUG))
+
+
 def log_config():
     """记录配置状态"""
-    if not DEBUG_CONFIG.get("log_configuration", False):
+    if not DEBUG_CONFIG.get("log_configuration", False) or not logger.isEnabledFor(logging.DEBUG):
         return
         
     logger.debug("📋 当前配置状态:")
@@ -60,7 +214,7 @@ def log_config():
 
 def log_page(page, operation="未知操作"):
     """记录页面状态"""
-    if not DEBUG_CONFIG.get("enabled", False) or not DEBUG_CONFIG.get("log_page_states", False):
+    if not _debug_enabled("log_page_states"):
         return
         
     try:
@@ -73,7 +227,7 @@ def log_page(page, operation="未知操作"):
 
 async def log_dom(page, operation="未知操作"):
     """记录DOM快照"""
-    if not DEBUG_CONFIG.get("enabled", False) or not DEBUG_CONFIG.get("log_dom_snapshots", False):
+    if not _debug_enabled("log_dom_snapshots"):
         return
         
     try:
@@ -90,7 +244,7 @@ async def log_dom(page, operation="未知操作"):
 
 def log_selector(selector, elements_found, operation="选择器查找"):
     """记录选择器查找"""
-    if not DEBUG_CONFIG.get("enabled", False) or not DEBUG_CONFIG.get("log_selectors", False):
+    if not _debug_enabled("log_selectors"):
         return
         
     logger.debug(f"🔍 {operation}:")
@@ -100,7 +254,7 @@ def log_selector(selector, elements_found, operation="选择器查找"):
 
 def log_video_parsing(videos, operation="视频解析"):
     """记录视频解析"""
-    if not DEBUG_CONFIG.get("enabled", False) or not DEBUG_CONFIG.get("log_video_parsing", False):
+    if not _debug_enabled("log_video_parsing"):
         return
         
     logger.debug(f"🎬 {operation}:")
@@ -119,7 +273,7 @@ def log_video_parsing(videos, operation="视频解析"):
 
 def log_retry(attempt, max_attempts, error, delay=None):
     """记录重试详情"""
-    if not DEBUG_CONFIG.get("enabled", False) or not DEBUG_CONFIG.get("log_retries", False):
+    if not _debug_enabled("log_retries"):
         return
         
     logger.debug(f"🔄 重试详情:")
@@ -132,7 +286,7 @@ def log_retry(attempt, max_attempts, error, delay=None):
 
 def log_pagination(page_num, total_pages=None, has_next=None):
     """记录分页信息"""
-    if not DEBUG_CONFIG.get("enabled", False) or not DEBUG_CONFIG.get("log_pagination", False):
+    if not _debug_enabled("log_pagination"):
         return
         
     logger.debug(f"📄 分页详情:")
@@ -153,6 +307,31 @@ def log_exception(operation, exception, context=None):
     logger.error(f"  完整堆栈跟踪:\n{traceback.format_exc()}")
 
 
+class PageRateLimiter:
+    """
+    页面请求速率限制器
+    
+    保证相邻两次页面请求的发起间隔不小于配置的随机间隔。
+    若上一次请求本身已经耗时超过该间隔，则无需额外等待。
+    """
+    
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._next_allowed = 0.0
+        
+    async def acquire(self):
+        """等待直到允许发起下一次页面请求"""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            if wait > 0:
+                logger.debug(f"⏱️ 速率限制等待: {wait:.2f} 秒")
+                await asyncio.sleep(wait)
+                now = self._next_allowed
+            interval = random.uniform(TIMING_CONFIG["page_interval_min"], TIMING_CONFIG["page_interval_max"])
+            self._next_allowed = now + interval
+
+
 class PlaywrightBrowserSimulator:
     """使用Playwright进行真实浏览器自动化的模拟器"""
     
@@ -163,6 +342,8 @@ class PlaywrightBrowserSimulator:
         self.browser = None
         self.context = None
         self.page = None
+        # 所有标签页共享同一个速率限制器，避免并发加载时请求过密
+        self.rate_limiter = PageRateLimiter()
         
     async def __aenter__(self):
         """异步上下文管理器入口"""
@@ -196,47 +377,34 @@ class PlaywrightBrowserSimulator:
                 '--no-sandbox',
                 '--disable-dev-shm-usage',
                 '--disable-blink-features=AutomationControlled',
-                '--disable-features=VizDisplayCompositor'
+                '--disable-features=VizDisplayCompositor,AutomationControlled'
             ]
         )
         
         # 创建浏览器上下文
         self.context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            extra_http_headers={
-                'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-            }
+            user_agent=_USER_AGENT,
+            extra_http_headers=_EXTRA_HTTP_HEADERS
         )
         
         # 设置反检测脚本
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined,
-            });
-            
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-            
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['zh-CN', 'zh', 'en'],
-            });
-            
-            window.chrome = {
-                runtime: {},
-            };
-            
-            Object.defineProperty(navigator, 'permissions', {
-                get: () => ({
-                    query: () => Promise.resolve({ state: 'granted' }),
-                }),
-            });
-        """)
+        stealth_js = _STEALTH_JS if self.browser_type == "chromium" else _WEBDRIVER_STEALTH_JS + _STEALTH_JS
+        await self.context.add_init_script(stealth_js)
+        
+        # 拦截图片、字体等爬取用不到的资源，保留文档/脚本/XHR以便页面正常渲染
+        if BROWSER_CONFIG["blocked_resource_types"]:
+            await self.context.route("**/*", self._block_resources)
         
         self.page = await self.context.new_page()
         
+    async def _block_resources(self, route):
+        """中止被配置为拦截的资源请求"""
+        if route.request.resource_type in BROWSER_CONFIG["blocked_resource_types"]:
+            await route.abort()
+        else:
+            await route.continue_()
+        
     async def close(self):
         """关闭浏览器"""
         if self.page:
@@ -248,6 +416,13 @@ class PlaywrightBrowserSimulator:
         if hasattr(self, 'playwright'):
             await self.playwright.stop()
             
+    async def reset_page(self):
+        """关闭当前标签页并在同一浏览器上下文中新建一个 (用于重试)"""
+        if self.page:
+            await self.page.close()
+        self.page = await self.context.new_page()
+        logger.debug("🔄 已重建浏览器标签页")
+            
     async def fetch_user_videos(self, uid, page_num=1, is_first_page=True):
         """获取用户视频页面内容"""
         logger.debug(f"🔄 开始获取用户 {uid} 第 {page_num} 页视频内容")
@@ -258,13 +433,11 @@ class PlaywrightBrowserSimulator:
             logger.debug(f"🌐 导航到首页: {url}")
             
             try:
+                await self.rate_limiter.acquire()
                 # 修复：避免使用networkidle，改用domcontentloaded提高速度
                 await self.page.goto(url, wait_until='domcontentloaded', timeout=TIMING_CONFIG["network_timeout"])
                 log_page(self.page, "首页导航完成")
-                
-                # 短暂等待确保关键元素加载完成
-                await self.page.wait_for_timeout(300)
-                logger.debug(f"⏱️ 页面加载等待完成: 300ms")
+                # 无需固定等待：下方的 wait_for_selector 会等待视频列表真正出现
             except Exception as e:
                 log_exception("首页导航", e, {"url": url, "uid": uid})
                 raise
@@ -282,44 +455,98 @@ class PlaywrightBrowserSimulator:
                 raise
         
         try:
-            # 等待视频列表加载，使用优化的超时时间但降低要求
-            selector = '.small-item, .bili-video-card'
-            logger.debug(f"🔍 等待视频列表选择器: {selector}")
-            await self.page.wait_for_selector(selector, timeout=TIMING_CONFIG["element_timeout"])
-            
-            # 检查找到的视频元素数量
-            video_elements = await self.page.query_selector_all(selector)
-            log_selector(selector, len(video_elements), "视频列表加载检查")
-            
-            # 优化：使用异步滚动，避免阻塞
-            logger.debug("📜 执行页面滚动以触发懒加载")
-            await self.page.evaluate("""
-                () => {
-                    // 快速异步滚动到页面底部触发懒加载
-                    window.scrollTo({top: document.body.scrollHeight, behavior: 'instant'});
-                    // 快速回到顶部确保所有内容可见
-                    setTimeout(() => window.scrollTo({top: 0, behavior: 'instant'}), 50);
-                }
-            """)
-            
-            # 减少等待时间：只等待必要的内容加载时间
-            wait_time = TIMING_CONFIG["page_load_wait"]
-            logger.debug(f"⏱️ 等待页面内容加载: {wait_time}ms")
-            await self.page.wait_for_timeout(wait_time)
-            
-            # 获取页面内容
-            content = await self.page.content()
-            logger.debug(f"📄 获取到页面内容，长度: {len(content)} 字符")
-            
-            # 记录DOM快照（如果启用）
-            await log_dom(self.page, f"第{page_num}页内容获取")
-            
-            return content
-            
+            return await self._collect_content(self.page, page_num)
         except Exception as e:
             log_exception("获取页面内容", e, {"page_num": page_num, "uid": uid})
             raise
 
+    async def fetch_page_by_url(self, uid, page_num):
+        """
+        通过pn参数直接加载指定页 (在同一浏览器上下文中新开标签页)
+        
+        :return: 页面HTML内容；页面没有视频列表时返回None
+        """
+        cached = _get_cached_page((uid, page_num))
+        if cached is not None:
+            logger.debug(f"📄 使用缓存的第 {page_num} 页内容")
+            return cached
+        
+        url = f"https://space.bilibili.com/{uid}/video?tid=0&keyword=&order=pubdate&pn={page_num}"
+        logger.debug(f"🌐 直接加载第 {page_num} 页: {url}")
+        
+        page = await self.context.new_page()
+        try:
+            await self.rate_limiter.acquire()
+            await page.goto(url, wait_until='domcontentloaded', timeout=TIMING_CONFIG["network_timeout"])
+            try:
+                content = await self._collect_content(page, page_num)
+                _store_cached_page((uid, page_num), content)
+                return content
+            except PlaywrightTimeoutError:
+                logger.info(f"第 {page_num} 页未找到视频列表（可能没有更多页面）")
+                return None
+        except Exception as e:
+            log_exception("直接加载分页", e, {"url": url, "page_num": page_num, "uid": uid})
+            raise
+        finally:
+            await page.close()
+
+    async def fetch_pages(self, uid, page_nums, concurrency=None):
+        """
+        并发加载多个分页
+        
+        :param uid: UP主UID
+        :param page_nums: 页码列表
+        :param concurrency: 最大并发标签页数 (None: 使用配置文件设置)
+        :return: 与page_nums顺序一致的结果列表，元素为HTML内容、None或异常对象
+        """
+        if concurrency is None:
+            concurrency = BROWSER_CONFIG["page_concurrency"]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def bounded_fetch(page_num):
+            async with semaphore:
+                return await self.fetch_page_by_url(uid, page_num)
+        
+        logger.debug(f"📄 并发加载第 {page_nums} 页，并发数: {concurrency}")
+        return await asyncio.gather(*(bounded_fetch(p) for p in page_nums), return_exceptions=True)
+
+    async def _collect_content(self, page, page_num):
+        """等待视频列表加载完成并返回页面内容"""
+        # 等待视频列表加载，使用优化的超时时间但降低要求
+        selector = '.small-item, .bili-video-card'
+        logger.debug(f"🔍 等待视频列表选择器: {selector}")
+        await page.wait_for_selector(selector, timeout=TIMING_CONFIG["element_timeout"])
+        
+        # 检查找到的视频元素数量
+        video_elements = await page.query_selector_all(selector)
+        log_selector(selector, len(video_elements), "视频列表加载检查")
+        
+        # 优化：使用异步滚动，避免阻塞
+        logger.debug("📜 执行页面滚动以触发懒加载")
+        await page.evaluate("""
+            () => {
+                // 快速异步滚动到页面底部触发懒加载
+                window.scrollTo({top: document.body.scrollHeight, behavior: 'instant'});
+                // 快速回到顶部确保所有内容可见
+                setTimeout(() => window.scrollTo({top: 0, behavior: 'instant'}), 50);
+            }
+        """)
+        
+        # 减少等待时间：只等待必要的内容加载时间
+        wait_time = TIMING_CONFIG["page_load_wait"]
+        logger.debug(f"⏱️ 等待页面内容加载: {wait_time}ms")
+        await page.wait_for_timeout(wait_time)
+        
+        # 获取页面内容
+        content = await page.content()
+        logger.debug(f"📄 获取到页面内容，长度: {len(content)} 字符")
+        
+        # 记录DOM快照（如果启用）
+        await log_dom(page, f"第{page_num}页内容获取")
+        
+        return content
+
     async def check_pagination_info(self):
         """检查分页信息，返回当前页和总页数"""
         logger.debug("🔍 开始检查分页信息")
@@ -419,6 +646,10 @@ class PlaywrightBrowserSimulator:
             logger.debug(f"🔍 等待分页区域加载: {pager_selector}")
             await self.page.wait_for_selector(pager_selector, timeout=TIMING_CONFIG["element_timeout"])
             
+            # 记录翻页前的首个视频链接，用于判断翻页后内容是否已刷新
+            previous_href = await self._first_video_href()
+            logger.debug(f"📌 翻页前首个视频链接: {previous_href}")
+            
             # 尝试多种分页按钮选择器
             pagination_selectors = [
                 f'.vui_button.vui_pagenation--btn-num:has-text("{target_page_num}")',
@@ -451,13 +682,9 @@ class PlaywrightBrowserSimulator:
                         logger.debug(f"🖱️ 点击第 {target_page_num} 页按钮")
                         await button.click()
                         
-                        # 修复：避免使用networkidle，改用domcontentloaded提高速度
-                        logger.debug("⏳ 等待页面加载完成")
-                        await self.page.wait_for_load_state('domcontentloaded', timeout=TIMING_CONFIG["network_timeout"])
-                        
-                        post_wait = TIMING_CONFIG["post_action_wait"]
-                        logger.debug(f"⏱️ 操作后等待: {post_wait}ms")
-                        await self.page.wait_for_timeout(post_wait)
+                        # 等待视频列表刷新，而不是等待加载状态 + 固定时长
+                        logger.debug("⏳ 等待视频列表刷新")
+                        await self._wait_for_page_change(previous_href)
                         
                         button_found = True
                         logger.info(f"成功点击第{target_page_num}页分页按钮")
@@ -501,13 +728,9 @@ class PlaywrightBrowserSimulator:
                             logger.debug("🖱️ 点击下一页按钮")
                             await button.click()
                             
-                            # 修复：避免使用networkidle，改用domcontentloaded提高速度
-                            logger.debug("⏳ 等待下一页加载完成")
-                            await self.page.wait_for_load_state('domcontentloaded', timeout=TIMING_CONFIG["network_timeout"])
-                            
-                            post_wait = TIMING_CONFIG["post_action_wait"]
-                            logger.debug(f"⏱️ 操作后等待: {post_wait}ms")
-                            await self.page.wait_for_timeout(post_wait)
+                            # 等待视频列表刷新，而不是等待加载状态 + 固定时长
+                            logger.debug("⏳ 等待下一页视频列表刷新")
+                            await self._wait_for_page_change(previous_href)
                             
                             button_found = True
                             logger.info(f"成功点击下一页按钮")
@@ -526,22 +749,44 @@ class PlaywrightBrowserSimulator:
             logger.error(f"导航到第{target_page_num}页失败: {e}")
             return False
             
-    def check_videos_too_old(self, page_videos, start_date):
-        """检查页面中的视频是否都太旧，超出了日期范围"""
+    async def _first_video_href(self):
+        """获取当前页面第一个视频卡片的链接"""
+        try:
+            return await self.page.evaluate(_FIRST_VIDEO_HREF_JS)
+        except Exception as e:
+            logger.debug(f"❌ 无法获取首个视频链接: {e}")
+            return None
+
+    async def _wait_for_page_change(self, previous_href):
+        """等待视频列表刷新（首个视频链接发生变化）"""
+        try:
+            await self.page.wait_for_function(
+                _VIDEO_LIST_CHANGED_JS,
+                arg=previous_href,
+                timeout=TIMING_CONFIG["network_timeout"]
+            )
+        except Exception as e:
+            # 内容未检测到变化时退回到固定等待，交由后续解析判断
+            post_wait = TIMING_CONFIG["post_action_wait"]
+            logger.debug(f"⏱️ 未检测到视频列表变化 ({e})，操作后等待: {post_wait}ms")
+            await self.page.wait_for_timeout(post_wait)
+
+    def check_videos_too_old(self, page_videos, start_date, start_timestamp=None):
+        """
+        检查页面中的视频是否都太旧，超出了日期范围
+        
+        :param start_timestamp: 起始日期的时间戳 (可选，已预先计算时传入以免重复解析日期)
+        """
         if not page_videos:
             return False
             
         # 转换start_date为时间戳
-        start_timestamp = datetime.datetime.strptime(start_date, "%Y-%m-%d").timestamp()
+        if start_timestamp is None:
+            start_timestamp = datetime.datetime.strptime(start_date, "%Y-%m-%d").timestamp()
         
-        # 检查页面中是否有视频在日期范围内
-        valid_videos = 0
-        for video in page_videos:
-            if video.get('created', 0) >= start_timestamp:
-                valid_videos += 1
-        
-        # 如果没有视频在日期范围内，说明视频太旧了
-        too_old = valid_videos == 0
+        # 最新的视频都早于起始日期，说明视频太旧了
+        newest_created = max(video.get('created', 0) for video in page_videos)
+        too_old = newest_created < start_timestamp
         if too_old:
             logger.info(f"页面中所有 {len(page_videos)} 个视频都早于起始日期 {start_date}，停止翻页")
         
@@ -550,11 +795,18 @@ class PlaywrightBrowserSimulator:
     def parse_videos_from_html(self, html_content):
         """解析HTML内容获取视频数据 - 增强版本，确保全部video card被处理"""
         logger.info("🎬 开始解析HTML内容获取视频数据")
+        
+        # 快速路径：直接从内嵌的__INITIAL_STATE__中读取视频列表，跳过HTML解析
+        videos = self._parse_initial_state(html_content)
+        if videos is not None:
+            logger.info(f"⚡ 从__INITIAL_STATE__解析到 {len(videos)} 个视频")
+            return videos
+        
         if not BS4_AVAILABLE:
             logger.error("BeautifulSoup4 not available, cannot parse HTML content")
             return []
             
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_PARSE_ONLY)
         logger.info(f"📄 HTML内容长度: {len(html_content)} 字符")
         
         # 增强：预验证页面是否包含预期的video card结构
@@ -567,11 +819,67 @@ class PlaywrightBrowserSimulator:
         self._validate_extraction(soup, videos)
         
         # 只在调试模式启用时记录详细的视频解析信息
-        if DEBUG_CONFIG.get("enabled", False) and DEBUG_CONFIG.get("log_video_parsing", False):
+        if _debug_enabled("log_video_parsing"):
             log_video_parsing(videos, "HTML解析完成")
             
         return videos
     
+    def _parse_initial_state(self, html_content):
+        """从内嵌的__INITIAL_STATE__ JSON中提取视频列表，未找到时返回None"""
+        # 先用子串查找定位，未出现时直接跳过正则；出现时从该位置开始匹配
+        start = html_content.find('window.__INITIAL_STATE__')
+        if start < 0:
+            return None
+        match = _INITIAL_STATE_RE.search(html_content, start)
+        if not match:
+            return None
+        
+        try:
+            state = _json_loads(match.group(1))
+        except ValueError as e:
+            logger.debug(f"🔍 __INITIAL_STATE__ 解析失败，回退到HTML解析: {e}")
+            return None
+        
+        vlist = self._find_vlist(state)
+        if vlist is None:
+            return None
+        
+        videos = []
+        for item in vlist:
+            try:
+                aid, play, comment, title, created = _VLIST_FIELDS(item)
+            except KeyError:
+                aid, play, comment, title, created = (item.get(key) for key in _VLIST_KEYS)
+            if not isinstance(aid, int) or aid <= 0:
+                continue
+            videos.append({
+                'aid': aid,
+                'view': play if isinstance(play, int) else 0,
+                'comment': comment if isinstance(comment, int) else 0,
+                'title': title or '',
+                'created': created if isinstance(created, int) else 0
+            })
+        return videos
+    
+    def _find_vlist(self, node):
+        """在初始状态中查找视频列表 (vlist字段)"""
+        if isinstance(node, dict):
+            vlist = node.get('vlist')
+            if isinstance(vlist, list) and vlist and isinstance(vlist[0], dict):
+                return vlist
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            return None
+        
+        for child in children:
+            if isinstance(child, (dict, list)):
+                vlist = self._find_vlist(child)
+                if vlist is not None:
+                    return vlist
+        return None
+    
     def _validate_page(self, soup):
         """验证页面结构"""
         # 检查是否存在常见的视频列表容器
@@ -615,7 +923,7 @@ class PlaywrightBrowserSimulator:
                         for link in all_video_links[:3]:  # 只显示前3个作为示例
                             href = link.get('href', '')
                             if '/video/av' in href:
-                                aid_match = re.search(r'/video/av(\d+)', href)
+                                aid_match = _AV_RE.search(href)
                                 if aid_match and int(aid_match.group(1)) not in extracted_aids:
                                     logger.debug(f"🔍 可能遗漏的视频: {href}")
                 else:
@@ -717,11 +1025,11 @@ class PlaywrightBrowserSimulator:
                 '.upload-content .video-body div[class*="video"]',  # 基于用户路径的模糊匹配
             ]
             
-            for selector in extended_selectors:
-                temp_cards = soup.select(selector)
-                if temp_cards:
-                    video_cards.extend(temp_cards)
-                    logger.info(f"📄 使用选择器 '{selector}' 找到 {len(temp_cards)} 个额外视频卡片")
+            # 合并为一个选择器，只遍历一次DOM (结果按文档顺序且不含重复元素)
+            temp_cards = soup.select(', '.join(extended_selectors))
+            if temp_cards:
+                video_cards.extend(temp_cards)
+                logger.info(f"📄 使用扩展选择器找到 {len(temp_cards)} 个额外视频卡片")
             
             # 去重（避免重复选择器匹配同一元素）
             unique_cards = []
@@ -761,14 +1069,14 @@ class PlaywrightBrowserSimulator:
                 
                 # 优化：使用更快的字符串匹配
                 if '/video/av' in href:
-                    aid_match = re.search(r'/video/av(\d+)', href)
+                    aid_match = _AV_RE.search(href)
                     if aid_match:
                         aid = int(aid_match.group(1))
                 elif '/video/BV' in href:
-                    # 优化：简化BV号处理
-                    bv_match = re.search(r'/video/(BV\w+)', href)
+                    # BV号可确定性地解码为AV号
+                    bv_match = _BV_RE.search(href)
                     if bv_match:
-                        aid = abs(hash(bv_match.group(1))) % (10**9)
+                        aid = _bv2av(bv_match.group(1))
                 
                 # 优化：简化标题提取 - 支持用户提供的具体选择器
                 title = ''
@@ -789,7 +1097,7 @@ class PlaywrightBrowserSimulator:
                 view_span = card.select_one('div.bili-cover-card__stats div:nth-child(1) span, .bili-video-card__stats div:nth-child(1) span')
                 if view_span:
                     view_text = view_span.get_text(strip=True)
-                    view_count = self._parse_stats_number(view_text)
+                    view_count = _parse_stats_number(view_text)
                     logger.debug(f"🔍 从stats选择器提取播放量: {view_text} -> {view_count}")
                 
                 # 如果没找到，尝试其他可能的播放量选择器
@@ -808,7 +1116,7 @@ class PlaywrightBrowserSimulator:
                             play_elem = card.select_one(selector)
                             if play_elem:
                                 play_text = play_elem.get_text(strip=True)
-                                temp_count = self._parse_stats_number(play_text)
+                                temp_count = _parse_stats_number(play_text)
                                 if temp_count > 0:
                                     view_count = temp_count
                                     logger.debug(f"🔍 从{selector}提取播放量: {play_text} -> {view_count}")
@@ -824,8 +1132,8 @@ class PlaywrightBrowserSimulator:
                         view_text = stats_spans[0].get_text(strip=True)
                         comment_text = stats_spans[1].get_text(strip=True)
                         
-                        view_count = self._parse_stats_number(view_text)
-                        comment_count = self._parse_stats_number(comment_text)
+                        view_count = _parse_stats_number(view_text)
+                        comment_count = _parse_stats_number(comment_text)
                         logger.debug(f"🔍 从通用stats选择器提取: 播放={view_count}, 评论={comment_count}")
                 
                 # 尝试获取评论数（如果还没有）
@@ -833,7 +1141,7 @@ class PlaywrightBrowserSimulator:
                     comment_span = card.select_one('div.bili-cover-card__stats div:nth-child(2) span, .bili-video-card__stats div:nth-child(2) span')
                     if comment_span:
                         comment_text = comment_span.get_text(strip=True)
-                        comment_count = self._parse_stats_number(comment_text)
+                        comment_count = _parse_stats_number(comment_text)
                         logger.debug(f"🔍 从评论选择器提取评论数: {comment_text} -> {comment_count}")
                 
                 # 修复：如果无法从统计元素提取到播放量，尝试从标题提取
@@ -845,7 +1153,7 @@ class PlaywrightBrowserSimulator:
                 created_timestamp = self._extract_timestamp(card)
                 
                 # 在调试模式下记录提取到的数据
-                if DEBUG_CONFIG.get("enabled", False) and DEBUG_CONFIG.get("log_video_parsing", False):
+                if _debug_enabled("log_video_parsing"):
                     logger.debug(f"🎬 解析视频卡片数据:")
                     logger.debug(f"  标题: {title[:50]}{'...' if len(title) > 50 else ''}")
                     logger.debug(f"  AID: {aid}")
@@ -865,7 +1173,7 @@ class PlaywrightBrowserSimulator:
                     parsed_count += 1
                     
                     # 只在调试模式下输出详细信息，并且只输出前3个视频作为示例
-                    if DEBUG_CONFIG.get("enabled", False) and DEBUG_CONFIG.get("log_video_parsing", False) and parsed_count <= 3:
+                    if _debug_enabled("log_video_parsing") and parsed_count <= 3:
                         logger.debug(f"🎬 视频 {parsed_count}: {title[:30]}{'...' if len(title) > 30 else ''}, AID={aid}, 播放={view_count}, 评论={comment_count}")
                 else:
                     failed_count += 1
@@ -900,76 +1208,25 @@ class PlaywrightBrowserSimulator:
             logger.warning("⚠️  未找到任何video card，可能页面结构发生变化或选择器需要更新")
         
         # 在调试模式下输出更多详细信息
-        if DEBUG_CONFIG.get("enabled", False) and DEBUG_CONFIG.get("log_video_parsing", False):
+        if _debug_enabled("log_video_parsing"):
             logger.debug(f"📊 解析统计 - 总卡片: {len(video_cards)}, 成功解析: {parsed_count}, 解析失败: {failed_count}")
             if parsed_count > 3:
                 logger.debug(f"... 还有 {parsed_count - 3} 个视频已成功解析（详细信息已省略以提高性能）")
         
         return videos
     
-    def _parse_stats_number(self, text):
-        """解析统计数字，支持中文数字格式"""
-        if not text:
-            return 0
-            
-        # 移除非数字字符，保留数字、小数点和中文单位
-        text = re.sub(r'[^\d.\u4e00-\u9fff万千百十亿]', '', text)
-        
-        try:
-            # 处理中文数字单位
-            if '万' in text:
-                num_str = text.replace('万', '')
-                if num_str:
-                    return int(float(num_str) * 10000)
-            elif '千' in text:
-                num_str = text.replace('千', '')
-                if num_str:
-                    return int(float(num_str) * 1000)
-            elif '百' in text:
-                num_str = text.replace('百', '')
-                if num_str:
-                    return int(float(num_str) * 100)
-            elif '亿' in text:
-                num_str = text.replace('亿', '')
-                if num_str:
-                    return int(float(num_str) * 100000000)
-            else:
-                # 纯数字
-                num_match = re.search(r'[\d.]+', text)
-                if num_match:
-                    return int(float(num_match.group()))
-        except (ValueError, AttributeError):
-            pass
-            
-        return 0
-
     def _extract_view_count(self, title):
         """提取播放量"""
         if not title:
             return 0
         
-        # 查找标题中的播放量模式，如 "4.0万", "3.7万", "32万" 等
-        view_patterns = [
-            r'(\d+\.?\d*)万',  # X.X万 or X万
-            r'(\d+\.?\d*)千',  # X.X千 or X千  
-            r'(\d+\.?\d*)亿',  # X.X亿 or X亿
-            r'(\d+\.?\d*)百',  # X.X百 or X百
-        ]
-        
-        for pattern in view_patterns:
-            match = re.search(pattern, title)
+        # 查找标题中的播放量模式
+        for pattern, multiplier in _VIEW_COUNT_PATTERNS:
+            match = pattern.search(title)
             if match:
-                num_str = match.group(1)
                 try:
-                    if '万' in pattern:
-                        return int(float(num_str) * 10000)
-                    elif '千' in pattern:
-                        return int(float(num_str) * 1000)
-                    elif '亿' in pattern:
-                        return int(float(num_str) * 100000000)
-                    elif '百' in pattern:
-                        return int(float(num_str) * 100)
-                except (ValueError, AttributeError):
+                    return int(float(match.group(1)) * multiplier)
+                except ValueError:
                     continue
         
         return 0
@@ -984,7 +1241,7 @@ class PlaywrightBrowserSimulator:
             spans_with_title = card.find_all('span', title=True)
             for span in spans_with_title:
                 title_text = span.get('title', '')
-                if title_text and ('2024' in title_text or '2023' in title_text or '小时前' in title_text or '分钟前' in title_text or '天前' in title_text):
+                if title_text and _TIME_HINT_RE.search(title_text):
                     timestamp = self._parse_time_fast(title_text)
                     if timestamp > 0:
                         if DEBUG_CONFIG.get("enabled", False):
@@ -1040,7 +1297,7 @@ class PlaywrightBrowserSimulator:
             spans = card.find_all('span')
             for span in spans:
                 text = span.get_text(strip=True)
-                if text and ('小时前' in text or '分钟前' in text or '天前' in text or '个月前' in text or '年前' in text):
+                if text and _RELATIVE_TIME_RE.search(text):
                     timestamp = self._parse_time_fast(text)
                     if timestamp > 0:
                         if DEBUG_CONFIG.get("enabled", False):
@@ -1106,16 +1363,14 @@ class PlaywrightBrowserSimulator:
                             return int(target_time.timestamp())
                         break
                             
-            # 快速处理常见的绝对时间格式，避免多次datetime.strptime调用
-            if '2024' in time_str or '2023' in time_str:
-                # 快速处理 "2024-01-15 12:30:45" 格式
-                if len(time_str) >= 10 and time_str[4] == '-' and time_str[7] == '-':
-                    try:
-                        date_part = time_str[:10]  # YYYY-MM-DD
-                        parsed_time = datetime.datetime.strptime(date_part, '%Y-%m-%d')
-                        return int(parsed_time.timestamp())
-                    except ValueError:
-                        pass
+            # 快速处理 "2024-01-15 12:30:45" 格式 (不限定具体年份)
+            if len(time_str) >= 10 and time_str[4] == '-' and time_str[7] == '-':
+                try:
+                    date_part = time_str[:10]  # YYYY-MM-DD
+                    parsed_time = datetime.datetime.strptime(date_part, '%Y-%m-%d')
+                    return int(parsed_time.timestamp())
+                except ValueError:
+                    pass
                         
         except Exception:
             # 移除所有debug日志以提高性能
@@ -1126,7 +1381,7 @@ class PlaywrightBrowserSimulator:
 
 
 
-async def fetch_videos(uid, start_date, end_date, extended_pages=False, headless=None):
+async def fetch_videos(uid, start_date, end_date, extended_pages=False, headless=None, browser=None):
     """
     获取指定日期范围内的视频数据 (使用Playwright浏览器自动化)
     
@@ -1135,6 +1390,7 @@ async def fetch_videos(uid, start_date, end_date, extended_pages=False, headless
     :param end_date: 结束日期 (YYYY-MM-DD)
     :param extended_pages: 是否启用扩展页数爬取 (用于历史数据计算，获取更多视频)
     :param headless: 是否使用无头模式 (None: 使用配置文件设置, True/False: 覆盖配置)
+    :param browser: 已启动的 PlaywrightBrowserSimulator，传入时复用该浏览器且不负责关闭
     :return: 视频列表 [{"aid": 视频ID, "view": 播放量, "comment": 评论数, "pubdate": 发布日期, "title": 标题, "created": 时间戳}]
     """
     
@@ -1142,12 +1398,12 @@ async def fetch_videos(uid, start_date, end_date, extended_pages=False, headless
         raise ImportError("Playwright库不可用，请安装: pip install playwright && playwright install chromium")
     
     logger.info(f"开始使用Playwright模式获取用户 {uid} 在 {start_date} 至 {end_date} 期间的视频数据")
-    return await fetch_videos_playwright(uid, start_date, end_date, extended_pages, headless)
+    return await fetch_videos_playwright(uid, start_date, end_date, extended_pages, headless, browser)
 
 
 
 
-async def fetch_videos_playwright(uid, start_date, end_date, extended_pages=False, headless=None):
+async def fetch_videos_playwright(uid, start_date, end_date, extended_pages=False, headless=None, browser=None):
     """
     使用Playwright真实浏览器获取视频数据
     
@@ -1156,12 +1412,138 @@ async def fetch_videos_playwright(uid, start_date, end_date, extended_pages=Fals
     :param end_date: 结束日期 (YYYY-MM-DD)
     :param extended_pages: 是否启用扩展页数爬取 (获取更多视频数据，用于历史计算)
     :param headless: 是否使用无头模式 (None: 使用配置文件设置, True/False: 覆盖配置)
+    :param browser: 已启动的 PlaywrightBrowserSimulator，传入时复用该浏览器且不负责关闭
     :return: 视频列表
     """
     
     if not PLAYWRIGHT_AVAILABLE:
         raise ImportError("Playwright库不可用，请安装: pip install playwright && playwright install chromium")
     
+    # 相同参数的重复调用直接返回缓存结果；同一参数的并发调用只爬取一次
+    cache_key = (uid, start_date, end_date, bool(extended_pages))
+    videos = _get_cached_videos(cache_key)
+    if videos is not None:
+        return videos
+    
+    lock = _VIDEO_CACHE_LOCKS.setdefault(cache_key, asyncio.Lock())
+    async with lock:
+        videos = _get_cached_videos(cache_key)
+        if videos is not None:
+            return videos
+        
+        videos = await _fetch_videos_playwright(uid, start_date, end_date, extended_pages, headless, browser)
+        _store_cached_videos(cache_key, videos)
+        return [dict(video) for video in videos]
+
+
+def _get_cached_videos(cache_key):
+    """读取未过期的缓存结果，返回副本；未命中返回None"""
+    entry = _VIDEO_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    
+    expires_at, videos = entry
+    if time.monotonic() >= expires_at:
+        del _VIDEO_CACHE[cache_key]
+        return None
+    
+    logger.info(f"使用缓存的视频数据: {len(videos)} 个视频 (UID: {cache_key[0]}, 日期范围: {cache_key[1]} 至 {cache_key[2]})")
+    return [dict(video) for video in videos]
+
+
+def _store_cached_videos(cache_key, videos):
+    """按配置的有效期缓存视频结果"""
+    ttl = BROWSER_CONFIG.get("cache_ttl", 0)
+    if ttl > 0:
+        _VIDEO_CACHE[cache_key] = (time.monotonic() + ttl, [dict(video) for video in videos])
+
+
+def clear_video_cache():
+    """清空视频结果缓存，强制下次调用重新爬取"""
+    _VIDEO_CACHE.clear()
+    logger.debug("🧹 已清空视频结果缓存")
+
+
+def _disk_cache_path(cache_key):
+    """分页HTML磁盘缓存文件路径 (当天有效)；未启用磁盘缓存时返回None"""
+    cache_dir = BROWSER_CONFIG.get("page_disk_cache_dir")
+    if not cache_dir:
+        return None
+    uid, page_num = cache_key
+    return pathlib.Path(cache_dir) / f"{uid}_{page_num}_{datetime.date.today().isoformat()}.html.gz"
+
+
+def _get_cached_page(cache_key):
+    """读取未过期的分页HTML缓存 (先内存后磁盘)；未命中返回None"""
+    entry = _PAGE_CACHE.get(cache_key)
+    if entry is not None:
+        expires_at, content = entry
+        if time.monotonic() < expires_at:
+            return content
+        del _PAGE_CACHE[cache_key]
+    
+    path = _disk_cache_path(cache_key)
+    if path is None or not path.exists():
+        return None
+    try:
+        content = gzip.decompress(path.read_bytes()).decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"读取分页磁盘缓存失败 {path}: {e}")
+        return None
+    _store_cached_page(cache_key, content, write_disk=False)
+    return content
+
+
+def _store_cached_page(cache_key, content, write_disk=True):
+    """缓存成功加载的分页HTML，超出容量时淘汰最早写入的页面"""
+    ttl = BROWSER_CONFIG.get("page_cache_ttl", 0)
+    if ttl > 0:
+        _PAGE_CACHE.pop(cache_key, None)
+        _PAGE_CACHE[cache_key] = (time.monotonic() + ttl, content)
+        while len(_PAGE_CACHE) > BROWSER_CONFIG.get("page_cache_size", 256):
+            del _PAGE_CACHE[next(iter(_PAGE_CACHE))]
+    
+    path = _disk_cache_path(cache_key) if write_disk else None
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(gzip.compress(content.encode('utf-8')))
+        except OSError as e:
+            logger.warning(f"写入分页磁盘缓存失败 {path}: {e}")
+
+
+def invalidate_page_cache(uid=None):
+    """
+    清除分页HTML缓存
+    
+    :param uid: 只清除指定UP主的页面 (None: 清除全部)
+    """
+    if uid is None:
+        _PAGE_CACHE.clear()
+    else:
+        for cache_key in [key for key in _PAGE_CACHE if key[0] == uid]:
+            del _PAGE_CACHE[cache_key]
+    
+    cache_dir = BROWSER_CONFIG.get("page_disk_cache_dir")
+    if cache_dir and pathlib.Path(cache_dir).is_dir():
+        pattern = "*.html.gz" if uid is None else f"{uid}_*.html.gz"
+        for path in pathlib.Path(cache_dir).glob(pattern):
+            path.unlink(missing_ok=True)
+    logger.debug(f"🧹 已清除分页HTML缓存 (UID: {uid if uid is not None else '全部'})")
+
+
+@asynccontextmanager
+async def _browser_session(browser, headless):
+    """复用调用方传入的浏览器；未传入时启动新浏览器并在结束后关闭"""
+    if browser is not None:
+        yield browser
+    else:
+        async with PlaywrightBrowserSimulator(headless=headless) as browser:
+            yield browser
+
+
+async def _fetch_videos_playwright(uid, start_date, end_date, extended_pages, headless, browser=None):
+    """实际执行Playwright爬取 (不经过缓存)"""
     # 记录函数调用参数
     logger.debug(f"🎬 Playwright模式参数:")
     logger.debug(f"  UID: {uid}")
@@ -1179,17 +1561,27 @@ async def fetch_videos_playwright(uid, start_date, end_date, extended_pages=Fals
     
     all_videos = []
     
-    for attempt in range(BROWSER_CONFIG["retry_attempts"]):
-        try:
-            log_retry(attempt, BROWSER_CONFIG["retry_attempts"], "开始尝试", None)
-            logger.info(f"Playwright模式 - 第 {attempt + 1} 次尝试获取视频数据...")
+    # 预先计算日期范围对应的时间戳（含结束日当天），逐条比较整数即可
+    start_ts = int(datetime.datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+    end_ts = int((datetime.datetime.strptime(end_date, "%Y-%m-%d") + datetime.timedelta(days=1)).timestamp()) - 1
+    
+    # 在重试之间复用同一个浏览器实例，重试时只需重建标签页
+    async with _browser_session(browser, headless) as browser:
+        for attempt in range(BROWSER_CONFIG["retry_attempts"]):
+            try:
+                log_retry(attempt, BROWSER_CONFIG["retry_attempts"], "开始尝试", None)
+                logger.info(f"Playwright模式 - 第 {attempt + 1} 次尝试获取视频数据...")
             
-            async with PlaywrightBrowserSimulator(headless=headless) as browser:
+                if attempt > 0:
+                    await browser.reset_page()
+                
                 page = 1
                 consecutive_failures = 0  # 连续失败页数
                 max_consecutive_failures = 2  # 允许的最大连续失败页数
                 consecutive_empty_pages = 0  # 连续空页数（没有符合日期范围的视频）
                 max_consecutive_empty = 3  # 允许的最大连续空页数
+                total_pages = None  # 首页分页信息中的总页数
+                concurrency = max(1, BROWSER_CONFIG["page_concurrency"])
                 
                 # 优化：减少最大页数限制，提高爬取效率
                 if extended_pages:
@@ -1201,91 +1593,129 @@ async def fetch_videos_playwright(uid, start_date, end_date, extended_pages=Fals
                     logger.info("使用智能分页检测获取视频数据")
                     logger.debug(f"📄 标准模式最大页数: {max_pages}")
                 
-                while page <= max_pages:
-                    try:
-                        logger.info(f"正在获取第 {page} 页数据...")
-                        logger.debug(f"📄 当前页面状态 - 页数: {page}/{max_pages}, 连续失败: {consecutive_failures}, 连续空页: {consecutive_empty_pages}")
-                        
-                        # 首页直接导航，后续页面通过点击分页按钮导航
-                        is_first_page = (page == 1)
-                        html_content = await browser.fetch_user_videos(uid, page, is_first_page=is_first_page)
-                        
-                        # 如果获取内容失败（比如点击按钮失败），停止翻页
-                        if html_content is None:
-                            logger.info(f"第 {page} 页无法获取内容（可能没有更多页面），停止翻页")
-                            break
-                        
-                        logger.debug(f"📄 第 {page} 页HTML内容长度: {len(html_content) if html_content else 0} 字符")
-                        
-                        # 检查分页信息
-                        pagination_info = await browser.check_pagination_info()
-                        logger.debug(f"📄 第 {page} 页分页信息: {pagination_info}")
-                        
-                        # 解析视频数据
-                        page_videos = browser.parse_videos_from_html(html_content)
-                        log_video_parsing(page_videos, f"第{page}页解析结果")
-                        
-                        if not page_videos:
-                            logger.info(f"第 {page} 页没有更多视频数据，停止翻页")
-                            break
-                        
-                        logger.info(f"第 {page} 页成功解析到 {len(page_videos)} 个视频")
-                        
-                        # 检查视频是否太旧
-                        if browser.check_videos_too_old(page_videos, start_date):
-                            logger.info("检测到视频太旧，停止翻页")
-                            break
-                        
-                        # 筛选指定日期范围内的视频
-                        valid_videos_count = 0
-                        for video in page_videos:
-                            if video['created'] > 0:
-                                pubdate = datetime.datetime.fromtimestamp(video['created']).strftime("%Y-%m-%d")
-                                if start_date <= pubdate <= end_date:
-                                    video['pubdate'] = pubdate
-                                    all_videos.append(video)
-                                    valid_videos_count += 1
-                        
-                        logger.info(f"第 {page} 页有 {valid_videos_count} 个视频符合日期范围 {start_date} 至 {end_date}")
-                        
-                        # 智能停止条件
-                        if valid_videos_count == 0:
-                            consecutive_empty_pages += 1
-                            logger.info(f"连续 {consecutive_empty_pages} 页没有符合条件的视频")
-                            if consecutive_empty_pages >= max_consecutive_empty:
-                                logger.info("连续多页没有符合条件的视频，停止翻页")
+                stop_paging = False
+                while page <= max_pages and not stop_paging:
+                    # 首页直接导航以读取分页信息，后续页面通过pn参数并发加载
+                    if page == 1:
+                        batch = [1]
+                        try:
+                            contents = [await browser.fetch_user_videos(uid, 1, is_first_page=True)]
+                        except Exception as e:
+                            contents = [e]
+                    else:
+                        last_page = min(page + concurrency - 1, max_pages)
+                        if total_pages and total_pages > 1:
+                            last_page = min(last_page, total_pages)
+                        batch = list(range(page, last_page + 1))
+                        logger.info(f"正在并发获取第 {batch[0]}-{batch[-1]} 页数据...")
+                        contents = await browser.fetch_pages(uid, batch, concurrency)
+                    
+                    # 解析为CPU密集操作，放入线程池与后续的浏览器I/O重叠执行
+                    parse_tasks = [
+                        asyncio.create_task(asyncio.to_thread(browser.parse_videos_from_html, content))
+                        if isinstance(content, str) else None
+                        for content in contents
+                    ]
+                    
+                    for page_num, html_content, parse_task in zip(batch, contents, parse_tasks):
+                        try:
+                            logger.info(f"正在处理第 {page_num} 页数据...")
+                            logger.debug(f"📄 当前页面状态 - 页数: {page_num}/{max_pages}, 连续失败: {consecutive_failures}, 连续空页: {consecutive_empty_pages}")
+                            
+                            if isinstance(html_content, Exception):
+                                raise html_content
+                            
+                            # 如果获取内容失败（比如页面没有视频列表），停止翻页
+                            if html_content is None:
+                                logger.info(f"第 {page_num} 页无法获取内容（可能没有更多页面），停止翻页")
+                                stop_paging = True
                                 break
-                        else:
-                            consecutive_empty_pages = 0  # 重置连续空页计数
-                        
-                        # 检查是否还有下一页
-                        if not pagination_info['has_next']:
-                            logger.info("检测到没有下一页，停止翻页")
-                            break
-                        
-                        # 如果当前页已经是总页数，也停止
-                        if pagination_info['total_pages'] > 1 and page >= pagination_info['total_pages']:
-                            logger.info(f"已到达最后一页（{pagination_info['total_pages']}），停止翻页")
-                            break
-                        
-                        # 重置连续失败计数
-                        consecutive_failures = 0
-                        page += 1
-                        
-                        # 添加页面间隔，避免被检测为爬虫 - 使用动态时间配置
-                        await asyncio.sleep(random.uniform(TIMING_CONFIG["page_interval_min"], TIMING_CONFIG["page_interval_max"]))
-                        
-                    except Exception as e:
-                        consecutive_failures += 1
-                        logger.error(f"获取第 {page} 页数据失败 (连续失败 {consecutive_failures} 次): {e}")
-                        
-                        # 如果连续失败次数超过阈值，停止翻页
-                        if consecutive_failures >= max_consecutive_failures:
-                            logger.error(f"连续 {consecutive_failures} 页解析失败，停止翻页")
-                            break
-                        
-                        # 否则继续下一页
-                        page += 1
+                            
+                            logger.debug(f"📄 第 {page_num} 页HTML内容长度: {len(html_content)} 字符")
+                            
+                            # 首页检查分页信息
+                            pagination_info = None
+                            if page_num == 1:
+                                pagination_info = await browser.check_pagination_info()
+                                logger.debug(f"📄 第 {page_num} 页分页信息: {pagination_info}")
+                                total_pages = pagination_info['total_pages']
+                            
+                            # 解析视频数据
+                            page_videos = await parse_task
+                            log_video_parsing(page_videos, f"第{page_num}页解析结果")
+                            
+                            if not page_videos:
+                                logger.info(f"第 {page_num} 页没有更多视频数据，停止翻页")
+                                stop_paging = True
+                                break
+                            
+                            logger.info(f"第 {page_num} 页成功解析到 {len(page_videos)} 个视频")
+                            
+                            # 检查视频是否太旧
+                            if browser.check_videos_too_old(page_videos, start_date, start_ts):
+                                logger.info("检测到视频太旧，停止翻页")
+                                stop_paging = True
+                                break
+                            
+                            # 筛选指定日期范围内的视频
+                            valid_videos = [video for video in page_videos if start_ts <= video['created'] <= end_ts]
+                            for video in valid_videos:
+                                video['pubdate'] = _pubdate(video['created'])
+                            all_videos.extend(valid_videos)
+                            valid_videos_count = len(valid_videos)
+                            
+                            logger.info(f"第 {page_num} 页有 {valid_videos_count} 个视频符合日期范围 {start_date} 至 {end_date}")
+                            
+                            # 重置连续失败计数
+                            consecutive_failures = 0
+                            
+                            # 列表按发布时间倒序：本页末尾已早于起始日期，后续页面只会更旧
+                            if 0 < page_videos[-1]['created'] < start_ts:
+                                logger.info(f"第 {page_num} 页末尾视频已早于起始日期 {start_date}，停止翻页")
+                                stop_paging = True
+                                break
+                            
+                            # 智能停止条件
+                            if valid_videos_count == 0:
+                                consecutive_empty_pages += 1
+                                logger.info(f"连续 {consecutive_empty_pages} 页没有符合条件的视频")
+                                if consecutive_empty_pages >= max_consecutive_empty:
+                                    logger.info("连续多页没有符合条件的视频，停止翻页")
+                                    stop_paging = True
+                                    break
+                            else:
+                                consecutive_empty_pages = 0  # 重置连续空页计数
+                            
+                            if pagination_info is not None and not pagination_info['has_next']:
+                                logger.info("检测到没有下一页，停止翻页")
+                                stop_paging = True
+                                break
+                            
+                            # 如果当前页已经是总页数，也停止
+                            if total_pages and total_pages > 1 and page_num >= total_pages:
+                                logger.info(f"已到达最后一页（{total_pages}），停止翻页")
+                                stop_paging = True
+                                break
+                            
+                        except Exception as e:
+                            consecutive_failures += 1
+                            logger.error(f"获取第 {page_num} 页数据失败 (连续失败 {consecutive_failures} 次): {e}")
+                            
+                            # 如果连续失败次数超过阈值，停止翻页
+                            if consecutive_failures >= max_consecutive_failures:
+                                logger.error(f"连续 {consecutive_failures} 页解析失败，停止翻页")
+                                stop_paging = True
+                                break
+                    
+                    # 提前停止时丢弃剩余页面的解析结果
+                    for parse_task in parse_tasks:
+                        if parse_task is not None and not parse_task.done():
+                            parse_task.cancel()
+                    
+                    page = batch[-1] + 1
+                    
+                    # 页面间隔由浏览器的速率限制器统一控制，失败后额外等待
+                    if not stop_paging and page <= max_pages and consecutive_failures:
                         await asyncio.sleep(random.uniform(TIMING_CONFIG["failure_wait_min"], TIMING_CONFIG["failure_wait_max"]))
                 
                 
@@ -1298,17 +1728,17 @@ async def fetch_videos_playwright(uid, start_date, end_date, extended_pages=Fals
                 else:
                     raise Exception(f"未获取到符合日期范围 {start_date} 至 {end_date} 的任何视频数据")
                     
-        except Exception as e:
-            error_msg = str(e)
-            logger.warning(f"第 {attempt + 1} 次尝试失败: {error_msg}")
+            except Exception as e:
+                error_msg = str(e)
+                logger.warning(f"第 {attempt + 1} 次尝试失败: {error_msg}")
             
-            if attempt < BROWSER_CONFIG["retry_attempts"] - 1:
-                # 使用动态重试延迟
-                delay = BROWSER_CONFIG["retry_delay"] * (1.5 ** attempt)
-                logger.info(f"将在 {delay} 秒后重试...")
-                await asyncio.sleep(delay)
-            else:
-                logger.error("所有重试尝试均失败")
+                if attempt < BROWSER_CONFIG["retry_attempts"] - 1:
+                    # 使用动态重试延迟
+                    delay = BROWSER_CONFIG["retry_delay"] * (1.5 ** attempt)
+                    logger.info(f"将在 {delay} 秒后重试...")
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error("所有重试尝试均失败")
     
     # 如果所有重试尝试均失败，抛出最终错误
     logger.error("所有重试尝试均失败")
@@ -10,7 +10,51 @@ This provides more accurate historical index calculations based on the 7-day win
 """
 
 import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> datetime.date:
+    """
+    解析 YYYY-MM-DD 格式的发布日期 (同一天发布的视频共享解析结果)
+    
+    :param date_str: 日期字符串
+    :return: 日期对象
+    """
+    return datetime.date.fromisoformat(date_str)
+
+
+def _dated_videos(videos: List[Dict]) -> List[Tuple[Dict, Optional[datetime.date]]]:
+    """
+    解析每个视频的发布日期，返回 (视频, 发布日期) 列表
+    优先使用 pubdate，其次使用 created 时间戳；无日期信息的视频日期为 None，
+    日期格式错误的视频被跳过
+    
+    :param videos: 视频数据列表
+    :return: (视频, 发布日期或None) 列表
+    """
+    dated = []
+    for video in videos:
+        # 检查视频是否有发布日期信息
+        if 'pubdate' in video and video['pubdate']:
+            try:
+                dated.append((video, _parse_date(video['pubdate'])))
+            except (ValueError, TypeError):
+                # 如果日期格式错误，跳过该视频
+                continue
+        elif 'created' in video and video['created']:
+            # 如果没有 pubdate 但有 created 时间戳，使用 created
+            try:
+                dated.append((video, datetime.datetime.fromtimestamp(video['created']).date()))
+            except (ValueError, TypeError, OSError):
+                # 如果时间戳格式错误，跳过该视频
+                continue
+        else:
+            # 如果视频没有日期信息，为了向后兼容，假设它是很久之前发布的
+            # 这样在测试环境中不会因为缺少日期信息而失败
+            dated.append((video, None))
+    return dated
 
 
 class HistoricalCalculator:
@@ -36,10 +80,22 @@ class HistoricalCalculator:
         :param current_date: 当前日期 (YYYY-MM-DD)，默认为今天 (用于验证)
         :return: 基于7天日期范围内视频的历史指数值
         """
-        from calculator import calculate_index
-        
         if current_date is None:
-            current_date = datetime.date.today().strftime("%Y-%m-%d")
+            current_date = datetime.date.today().isoformat()
+        
+        return self._calc_from_dated(_dated_videos(videos), target_date, current_date)
+    
+    def _calc_from_dated(self, dated_videos: List[Tuple[Dict, Optional[datetime.date]]],
+                         target_date: str, current_date: str) -> float:
+        """
+        基于已解析发布日期的视频计算指定日期的指数
+        
+        :param dated_videos: _dated_videos 的返回值
+        :param target_date: 目标历史日期 (YYYY-MM-DD)
+        :param current_date: 当前日期 (YYYY-MM-DD)
+        :return: 基于7天日期范围内视频的历史指数值
+        """
+        from calculator import calculate_index
         
         # 验证目标日期不能晚于当前日期
         current_dt = datetime.datetime.strptime(current_date, "%Y-%m-%d").date()
@@ -52,31 +108,11 @@ class HistoricalCalculator:
         start_date = target_dt - datetime.timedelta(days=6)
         end_date = target_dt
         
-        # 筛选目标日期范围内发布的视频
-        filtered_videos = []
-        for video in videos:
-            # 检查视频是否有发布日期信息
-            if 'pubdate' in video and video['pubdate']:
-                try:
-                    video_date = datetime.datetime.strptime(video['pubdate'], "%Y-%m-%d").date()
-                    if start_date <= video_date <= end_date:
-                        filtered_videos.append(video)
-                except (ValueError, TypeError):
-                    # 如果日期格式错误，跳过该视频
-                    continue
-            elif 'created' in video and video['created']:
-                # 如果没有 pubdate 但有 created 时间戳，使用 created
-                try:
-                    video_date = datetime.datetime.fromtimestamp(video['created']).date()
-                    if start_date <= video_date <= end_date:
-                        filtered_videos.append(video)
-                except (ValueError, TypeError, OSError):
-                    # 如果时间戳格式错误，跳过该视频
-                    continue
-            else:
-                # 如果视频没有日期信息，为了向后兼容，假设它是很久之前发布的
-                # 这样在测试环境中不会因为缺少日期信息而失败
-                filtered_videos.append(video)
+        # 筛选目标日期范围内发布的视频（无日期信息的视频为了向后兼容始终计入）
+        filtered_videos = [
+            video for video, video_date in dated_videos
+            if video_date is None or start_date <= video_date <= end_date
+        ]
         
         # 基于筛选后的视频数据计算指数
         return calculate_index(filtered_videos)
@@ -93,12 +129,17 @@ class HistoricalCalculator:
         :param current_date: 当前日期 (YYYY-MM-DD)，默认为今天
         :return: 历史数据列表 [{"date": "YYYY-MM-DD", "index": float, "approximated": true}]
         """
+        if current_date is None:
+            current_date = datetime.date.today().isoformat()
+        
+        # 视频发布日期只解析一次，所有目标日期共用
+        dated_videos = _dated_videos(videos)
         results = []
         
         for date in date_range:
             try:
-                historical_index = self.calc_historical_index(
-                    videos, date, current_date
+                historical_index = self._calc_from_dated(
+                    dated_videos, date, current_date
                 )
                 results.append({
                     "date": date,
@@ -128,10 +169,10 @@ class HistoricalCalculator:
         :param current_date: 当前日期 (YYYY-MM-DD)，默认为今天
         :return: 详细的调试信息字典
         """
-        from calculator import calculate_index, get_video_details
+        from calculator import calculate_index, iter_video_details
         
         if current_date is None:
-            current_date = datetime.date.today().strftime("%Y-%m-%d")
+            current_date = datetime.date.today().isoformat()
             
         debug_info = {
             "target_date": target_date,
@@ -185,7 +226,7 @@ class HistoricalCalculator:
                 
                 if 'pubdate' in video and video['pubdate']:
                     try:
-                        video_date = datetime.datetime.strptime(video['pubdate'], "%Y-%m-%d").date()
+                        video_date = _parse_date(video['pubdate'])
                         video_date_analysis["videos_with_pubdate"] += 1
                         date_source = "pubdate"
                     except (ValueError, TypeError):
@@ -209,7 +250,7 @@ class HistoricalCalculator:
                         video_date_analysis["date_range"]["latest"] = video_date
                     
                     # 按日期统计视频数量
-                    date_str = video_date.strftime("%Y-%m-%d")
+                    date_str = video_date.isoformat()
                     if date_str not in video_date_analysis["videos_by_date"]:
                         video_date_analysis["videos_by_date"][date_str] = []
                     video_date_analysis["videos_by_date"][date_str].append({
@@ -245,7 +286,7 @@ class HistoricalCalculator:
                 
                 if 'pubdate' in video and video['pubdate']:
                     try:
-                        video_date = datetime.datetime.strptime(video['pubdate'], "%Y-%m-%d").date()
+                        video_date = _parse_date(video['pubdate'])
                         if start_date <= video_date <= end_date:
                             include_video = True
                             filtering_details["videos_in_range"] += 1
@@ -298,7 +339,6 @@ class HistoricalCalculator:
             
             # 步骤5: 计算指数
             if filtered_videos:
-                detailed_videos = get_video_details(filtered_videos)
                 total_index = calculate_index(filtered_videos)
                 
                 debug_info["calculation_steps"].append({
@@ -312,8 +352,8 @@ class HistoricalCalculator:
                             "view": v["view"],
                             "comment": v["comment"],
                             "contribution": v["contribution"]
-                        } for v in detailed_videos[:10]  # 只显示前10个
-                    ] + ([{"note": f"... 还有 {len(detailed_videos) - 10} 个视频"}] if len(detailed_videos) > 10 else [])
+                        } for v in iter_video_details(filtered_videos[:10])  # 只显示前10个
+                    ] + ([{"note": f"... 还有 {len(filtered_videos) - 10} 个视频"}] if len(filtered_videos) > 10 else [])
                 })
                 
                 debug_info["final_result"] = {
@@ -359,7 +399,7 @@ class HistoricalCalculator:
         dates = []
         current_dt = start_dt
         while current_dt <= end_dt:
-            dates.append(current_dt.strftime("%Y-%m-%d"))
+            dates.append(current_dt.isoformat())
             current_dt += datetime.timedelta(days=1)
         
         return dates
@@ -469,14 +509,28 @@ def debug_batch_calculation(videos: List[Dict], date_range: List[str],
     indices = [r["index"] for r in all_results if "error" not in r]
     
     if indices:
-        increasing_count = sum(1 for i in range(1, len(indices)) if indices[i] > indices[i-1])
+        # 单次遍历同时统计最小值、最大值、总和、去重值和上升次数
+        min_index = max_index = previous = indices[0]
+        total = 0.0
+        unique_values = set()
+        increasing_count = 0
+        for value in indices:
+            total += value
+            unique_values.add(value)
+            if value < min_index:
+                min_index = value
+            elif value > max_index:
+                max_index = value
+            if value > previous:
+                increasing_count += 1
+            previous = value
         
         batch_debug["summary_analysis"] = {
             "total_calculations": len(indices),
-            "min_index": min(indices),
-            "max_index": max(indices),
-            "mean_index": sum(indices) / len(indices),
-            "unique_values": len(set(indices)),
+            "min_index": min_index,
+            "max_index": max_index,
+            "mean_index": total / len(indices),
+            "unique_values": len(unique_values),
             "increasing_transitions": increasing_count,
             "increasing_percentage": (increasing_count / (len(indices) - 1) * 100) if len(indices) > 1 else 0,
             "potential_stacking_issue": increasing_count / (len(indices) - 1) > 0.7 if len(indices) > 1 else False
@@ -13,12 +13,12 @@ Uses Playwright browser automation with strongest anti-detection capabilities.
 import datetime
 import asyncio
 import argparse
+import traceback
 
 from config import BILIBILI_UID, DEFAULT_DAYS_RANGE
 from crawler import fetch_videos, get_troubleshooting,enable_debug
 from calculator import calculate_index
-from storage import save_all_data, load_history_data
-from visualizer import generate_all_charts, generate_historical_charts
+from storage import save_all_data, load_history_data, write_json
 from historical import calc_historical_index, calc_batch_historical, HistoricalCalculator
 
 
@@ -272,7 +272,7 @@ async def run_historical_mode(args, headless=None):
     print("使用当前视频数据作为历史数据近似")
     print("=" * 50)
     
-    current_date = datetime.date.today().strftime("%Y-%m-%d")
+    current_date = datetime.date.today().isoformat()
     
     # 验证历史日期参数，防止未来日期
     try:
@@ -325,7 +325,6 @@ async def run_historical_mode(args, headless=None):
             
     except Exception as e:
         print(f"历史计算过程中发生错误: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -343,11 +342,9 @@ async def calc_single_date(videos, args, current_date, current_index):
             videos, target_date, current_date
         )
         
-        days_diff = (datetime.datetime.strptime(current_date, "%Y-%m-%d").date() - 
-                    datetime.datetime.strptime(target_date, "%Y-%m-%d").date()).days
-        
-        effective_days_diff = (datetime.datetime.strptime(current_date, "%Y-%m-%d").date() - 
-                              effective_date).days
+        current_dt = datetime.datetime.strptime(current_date, "%Y-%m-%d").date()
+        days_diff = (current_dt - datetime.datetime.strptime(target_date, "%Y-%m-%d").date()).days
+        effective_days_diff = (current_dt - effective_date).days
         
         print(f"\n计算结果:")
         print(f"- 显示日期: {target_date} ({days_diff}天前)")
@@ -454,12 +451,10 @@ async def calc_batch_dates(videos, args, current_date, current_index):
                 
         except Exception as chart_error:
             print(f"✗ 图表生成失败: {chart_error}")
-            import traceback
             traceback.print_exc()
         
         # 同时保存批量结果到单独文件
         filename = f"historical_batch_{start_date}_{end_date}.json"
-        import json
         
         # 添加元数据说明历史计算方法
         output_data = {
@@ -469,8 +464,7 @@ async def calc_batch_dates(videos, args, current_date, current_index):
             "results": results
         }
         
-        with open(filename, "w", encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        write_json(filename, output_data)
         print(f"\n批量结果已保存到: {filename}")
         print(f"已将 {success_count} 条历史数据保存到累积数据文件")
         print(f"注意: 所有历史日期使用相同的当前视频数据进行近似计算")
@@ -559,12 +553,10 @@ async def calc_default_range(videos, args, current_date, current_index):
                 
         except Exception as chart_error:
             print(f"✗ 图表生成失败: {chart_error}")
-            import traceback
             traceback.print_exc()
         
         # 保存默认结果到单独文件
         filename = f"historical_week_{current_date}.json"
-        import json
         
         # 添加元数据说明历史计算方法
         output_data = {
@@ -573,8 +565,7 @@ async def calc_default_range(videos, args, current_date, current_index):
             "results": results
         }
         
-        with open(filename, "w", encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        write_json(filename, output_data)
         print(f"\n历史数据已保存到: {filename}")
         print(f"已将 {success_count} 条历史数据保存到累积数据文件")
         print(f"注意: 所有历史日期使用相同的当前视频数据进行近似计算")
@@ -587,8 +578,9 @@ async def run_current_mode(args, headless=None):
     """原有的当前指数计算模式"""
     
     # 获取当前日期
-    d = datetime.date.today().strftime("%Y-%m-%d")
-    start_date = (datetime.date.today() - datetime.timedelta(days=DEFAULT_DAYS_RANGE-1)).strftime("%Y-%m-%d")
+    today = datetime.date.today()
+    d = today.isoformat()
+    start_date = (today - datetime.timedelta(days=DEFAULT_DAYS_RANGE-1)).isoformat()
     
     print(f"开始计算李大霄指数 (Playwright浏览器自动化模式)...")
     print(f"日期范围: {start_date} 至 {d}")
@@ -612,6 +604,7 @@ async def run_current_mode(args, headless=None):
         
         # 生成可视化图表
         print("正在生成图表...")
+        from visualizer import generate_all_charts
         history_data = load_history_data()
         generate_all_charts(videos, d, index_value, history_data)
         
@@ -9,18 +9,13 @@ showing detailed calculation steps and intermediate results.
 """
 
 import datetime
-import json
-import sys
-import os
 import asyncio
 import argparse
+import traceback
 
-# 添加当前目录到路径，确保可以导入其他模块
-sys.path.insert(0, os.path.dirname(__file__))
-
-from config import BILIBILI_UID, DEFAULT_DAYS_RANGE
+from config import BILIBILI_UID, DEFAULT_DAYS_RANGE, VIEW_DIVISOR, COMMENT_DIVISOR
 from crawler import fetch_videos
-from calculator import calculate_index, get_video_details, calc_contribution
+from calculator import calculate_index, iter_video_details, calc_contribution
 from historical import HistoricalCalculator, debug_calculation_process
 
 
@@ -44,8 +39,9 @@ async def generate_detailed_report(target_date=None):
     
     :param target_date: 目标日期，如果为None则使用今天
     """
+    today = datetime.date.today().isoformat()
     if target_date is None:
-        target_date = datetime.date.today().strftime("%Y-%m-%d")
+        target_date = today
     else:
         # 验证日期格式
         try:
@@ -112,8 +108,9 @@ async def generate_detailed_report(target_date=None):
         
         # 4. 指数计算详情
         print_subsection("第四步: 指数计算详情")
+        index_value = 0.0
         if videos:
-            detailed_videos = get_video_details(videos)
+            detailed_videos = iter_video_details(videos)
             index_value = calculate_index(videos)
             
             print("计算公式: 李大霄指数 = Σ(播放量/10000 + 评论数/100)")
@@ -122,8 +119,8 @@ async def generate_detailed_report(target_date=None):
             
             print("各视频贡献度分解:")
             for i, video in enumerate(detailed_videos):
-                view_contribution = video['view'] / 10000
-                comment_contribution = video['comment'] / 100
+                view_contribution = video['view'] / VIEW_DIVISOR
+                comment_contribution = video['comment'] / COMMENT_DIVISOR
                 print(f"  {i+1:2d}. {video.get('title', 'Unknown')[:30]:<30} "
                       f"播放贡献: {view_contribution:>6.2f} "
                       f"评论贡献: {comment_contribution:>6.2f} "
@@ -133,7 +130,7 @@ async def generate_detailed_report(target_date=None):
         print()
         
         # 5. 如果是历史计算，提供详细的调试信息
-        if target_date != datetime.date.today().strftime("%Y-%m-%d"):
+        if target_date != today:
             print_subsection("第五步: 历史计算调试信息")
             debug_info = debug_calculation_process(videos, target_date)
             
@@ -169,10 +166,7 @@ async def generate_detailed_report(target_date=None):
         print(f"计算完成时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"数据日期范围: {start_date} 至 {target_date}")
         print(f"处理视频数量: {len(videos)}")
-        if videos:
-            print(f"李大霄指数: {calculate_index(videos):.2f}")
-        else:
-            print("李大霄指数: 0.00")
+        print(f"李大霄指数: {index_value:.2f}")
         
         print()
         print("报告生成完成！")
@@ -180,7 +174,6 @@ async def generate_detailed_report(target_date=None):
     except Exception as e:
         print_separator("错误信息")
         print(f"生成报告时发生错误: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 
@@ -198,7 +191,6 @@ async def main():
         print("\n用户取消操作")
     except Exception as e:
         print(f"执行报告生成时发生错误: {e}")
-        import traceback
         traceback.print_exc()
 
 
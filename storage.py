@@ -10,6 +10,25 @@ This module handles JSON file operations for saving and loading index data.
 import json
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def write_json(filename, data):
+    """
+    写入格式化的JSON文件 (2空格缩进，保留中文字符)
+    优先使用orjson一次性序列化为字节，不可用时回退到标准库json
+    """
+    if ORJSON_AVAILABLE:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 def save_daily_data(date, index_value):
     """
@@ -20,8 +39,7 @@ def save_daily_data(date, index_value):
     from config import DAILY_FILE_TEMPLATE
     
     filename = DAILY_FILE_TEMPLATE.format(date=date)
-    with open(filename, "w", encoding='utf-8') as f:
-        json.dump({"date": date, "index": index_value}, f, indent=2, ensure_ascii=False)
+    write_json(filename, {"date": date, "index": index_value})
 
 
 def update_history_data(date, index_value):
@@ -32,21 +50,12 @@ def update_history_data(date, index_value):
     """
     from config import HISTORY_FILE
     
-    history_data = load_history_data()
-    
-    # 检查是否已存在当日数据，如果存在则更新，否则添加
-    updated = False
-    for item in history_data:
-        if item["date"] == date:
-            item["index"] = index_value
-            updated = True
-            break
-    
-    if not updated:
-        history_data.append({"date": date, "index": index_value})
+    # 按日期建立索引，已存在当日数据则覆盖，否则新增
+    history_by_date = {item["date"]: item for item in load_history_data()}
+    history_by_date[date] = {"date": date, "index": index_value}
     
-    with open(HISTORY_FILE, "w", encoding='utf-8') as f:
-        json.dump(history_data, f, indent=2, ensure_ascii=False)
+    # 按日期顺序写回
+    write_json(HISTORY_FILE, [history_by_date[d] for d in sorted(history_by_date)])
 
 
 def load_history_data():
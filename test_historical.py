@@ -150,6 +150,29 @@ def test_convenience_functions():
     print("✓ 便捷函数测试通过")
 
 
+def test_batch_matches_single_date():
+    """测试批量计算与逐日计算结果一致"""
+    print("\nTesting batch vs single date consistency...")
+
+    mock_videos = [
+        {"view": 50000, "comment": 1000, "pubdate": "2024-08-15"},
+        {"view": 30000, "comment": 500, "pubdate": "2024-08-20"},
+        {"view": 20000, "comment": 300, "pubdate": "bad-date"},
+        {"view": 10000, "comment": 100}
+    ]
+
+    calculator = HistoricalCalculator()
+    date_range = ["2024-08-14", "2024-08-18", "2024-08-22", "2024-08-30"]
+    results = calculator.calc_batch_historical(mock_videos, date_range, "2024-08-28")
+
+    for result in results[:3]:
+        expected = calculator.calc_historical_index(mock_videos, result["date"], "2024-08-28")
+        assert result["index"] == round(expected, 2), f"Mismatch on {result['date']}"
+    assert "error" in results[3], "Future date should be reported as error"
+
+    print("✓ 批量与逐日计算一致性测试通过")
+
+
 def run_all_tests():
     """运行所有测试"""
     print("=" * 50)
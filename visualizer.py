@@ -7,13 +7,36 @@ Data Visualization Module
 This module handles chart generation for Li Daxiao index data.
 """
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for headless environments
-import matplotlib.pyplot as plt
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 
-# Configure Chinese font support
-plt.rcParams['font.sans-serif'] = [ 'SimHei', 'Microsoft YaHei']
-plt.rcParams['axes.unicode_minus'] = False
+# 所有图表复用同一个Figure (及其Agg画布)，避免每张图都重新创建
+_FIGURE_NUM = "lidaxiao"
+
+
+@lru_cache(maxsize=None)
+def _pyplot():
+    """
+    延迟导入matplotlib (仅在首次绘图时加载并完成配置)
+    导入matplotlib耗时数百毫秒，不绘图的运行无需承担
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend for headless environments
+    import matplotlib.pyplot as plt
+    
+    # Configure Chinese font support
+    plt.rcParams['font.sans-serif'] = [ 'SimHei', 'Microsoft YaHei']
+    plt.rcParams['axes.unicode_minus'] = False
+    return plt
+
+
+def _get_figure(figsize):
+    """获取共享的Figure并清空内容、设置尺寸"""
+    plt = _pyplot()
+    fig = plt.figure(num=_FIGURE_NUM, clear=True)
+    fig.set_size_inches(figsize)
+    return fig
 
 
 def plot_history_trend(history_data, current_date):
@@ -23,11 +46,12 @@ def plot_history_trend(history_data, current_date):
     :param current_date: 当前日期 (YYYY-MM-DD)
     """
     from config import CHART_FIGSIZE_HISTORY, HISTORY_CHART_TEMPLATE
+    plt = _pyplot()
     
     dates = [item["date"] for item in history_data]
     indices = [item["index"] for item in history_data]
     
-    plt.figure(figsize=CHART_FIGSIZE_HISTORY)
+    _get_figure(CHART_FIGSIZE_HISTORY)
     plt.plot(dates, indices, marker='o', linestyle='-', color='#1f77b4',
              linewidth=2.5, markersize=3, alpha=0.9)
     
@@ -84,7 +108,7 @@ def plot_history_trend(history_data, current_date):
     date_str = current_date.replace('-', '')
     filename = HISTORY_CHART_TEMPLATE.format(date_str=date_str)
     plt.savefig(filename, bbox_inches='tight', dpi=150)
-    plt.close()
+    plt.clf()
 
 
 def plot_daily_stack(videos, current_date, total_index):
@@ -97,44 +121,41 @@ def plot_daily_stack(videos, current_date, total_index):
     from config import (CHART_FIGSIZE_DAILY, CHART_FIGSIZE_NO_VIDEO, 
                        DAILY_CHART_TEMPLATE, TITLE_TRUNCATE_LENGTH,
                        VIEW_DIVISOR, COMMENT_DIVISOR)
+    plt = _pyplot()
     
     if not videos:
         # 无视频时的特殊处理
-        plt.figure(figsize=CHART_FIGSIZE_NO_VIDEO)
+        _get_figure(CHART_FIGSIZE_NO_VIDEO)
         plt.bar(["无视频"], [0], color='gray')
         plt.text(0, 0.1, "指数=0 (无视频贡献)", ha='center')
         plt.title(f"李大霄指数构成 ({current_date})")
         plt.ylabel("贡献值")
     else:
         # 按发布时间倒序排序 (最新视频在堆叠顶层)
-        sorted_videos = sorted(
-            videos, 
-            key=lambda v: v["created"], 
-            reverse=True
-        )
+        sorted_videos = sorted(videos, key=itemgetter("created"), reverse=True)
         titles = [v["title"][:TITLE_TRUNCATE_LENGTH] + "..." 
                  if len(v["title"]) > TITLE_TRUNCATE_LENGTH else v["title"] 
                  for v in sorted_videos]
         contributions = [(v["view"] / VIEW_DIVISOR + v["comment"] / COMMENT_DIVISOR) 
                         for v in sorted_videos]
         
-        # 生成堆叠柱状图
-        plt.figure(figsize=CHART_FIGSIZE_DAILY)
-        bottom = 0
-        for title, contribution in zip(titles, contributions):
-            plt.bar([current_date], [contribution], bottom=bottom, label=title)
-            bottom += contribution
+        # 生成堆叠柱状图：一次bar调用绘制所有分段，底部为前面各段贡献的累加
+        _get_figure(CHART_FIGSIZE_DAILY)
+        bottoms = list(accumulate(contributions, initial=0))[:-1]
+        colors = [f"C{i % 10}" for i in range(len(contributions))]
+        bars = plt.bar([current_date] * len(contributions), contributions, 
+                       bottom=bottoms, color=colors)
         
         plt.title(f"李大霄指数构成 ({current_date}) | 总指数: {total_index:.2f}")
         plt.ylabel("视频贡献值")
-        plt.legend(loc='upper right', bbox_to_anchor=(1.25, 1))
+        plt.legend(bars, titles, loc='upper right', bbox_to_anchor=(1.25, 1))
         plt.grid(axis='y', alpha=0.3)
     
     plt.tight_layout()
     date_str = current_date.replace('-', '')
     filename = DAILY_CHART_TEMPLATE.format(date_str=date_str)
     plt.savefig(filename, bbox_inches='tight')
-    plt.close()
+    plt.clf()
 
 
 def plot_historical_estimates(historical_data, current_date, model_name="hybrid"):
@@ -145,6 +166,7 @@ def plot_historical_estimates(historical_data, current_date, model_name="hybrid"
     :param model_name: 使用的模型名称
     """
     from config import CHART_FIGSIZE_HISTORY
+    plt = _pyplot()
     import numpy as np
     
     if not historical_data:
@@ -153,7 +175,7 @@ def plot_historical_estimates(historical_data, current_date, model_name="hybrid"
     dates = [item["date"] for item in historical_data]
     indices = [item["index"] for item in historical_data]
     
-    plt.figure(figsize=CHART_FIGSIZE_HISTORY)
+    _get_figure(CHART_FIGSIZE_HISTORY)
     
     # 绘制历史估算曲线
     plt.plot(dates, indices, marker='o', linestyle='-', color='#1f77b4', 
@@ -225,7 +247,7 @@ def plot_historical_estimates(historical_data, current_date, model_name="hybrid"
     date_str = current_date.replace('-', '')
     filename = f"historical_estimates_{model_name}_{date_str}.png"
     plt.savefig(filename, bbox_inches='tight', dpi=150)
-    plt.close()
+    plt.clf()
     
     return filename
 
@@ -239,20 +261,22 @@ def plot_model_comparison(videos, target_date, current_date, models=None):
     :param models: 要比较的模型列表，默认为所有模型
     """
     from config import CHART_FIGSIZE_HISTORY
-    from historical import HistoricalCalculator, calculate_batch_historical
+    plt = _pyplot()
+    from historical import HistoricalCalculator, calc_batch_historical
     
     if models is None:
         models = ["exponential", "linear", "hybrid"]
     
     # 生成日期范围
-    import datetime
-    target_dt = datetime.datetime.strptime(target_date, "%Y-%m-%d").date()
-    current_dt = datetime.datetime.strptime(current_date, "%Y-%m-%d").date()
-    
     calculator = HistoricalCalculator()
     date_list = calculator.generate_date_range(target_date, current_date)
     
-    plt.figure(figsize=CHART_FIGSIZE_HISTORY)
+    # 历史指数计算与模型无关，只需批量计算一次
+    results = calc_batch_historical(videos, date_list, current_date)
+    dates = [r["date"] for r in results]
+    indices = [r["index"] for r in results]
+    
+    _get_figure(CHART_FIGSIZE_HISTORY)
     
     colors = {'exponential': 'blue', 'linear': 'green', 'hybrid': 'orange'}
     model_names = {
@@ -262,10 +286,6 @@ def plot_model_comparison(videos, target_date, current_date, models=None):
     }
     
     for model in models:
-        results = calculate_batch_historical(videos, date_list, current_date)
-        dates = [r["date"] for r in results]
-        indices = [r["index"] for r in results]
-        
         plt.plot(dates, indices, marker='o', linestyle='-', 
                 color=colors.get(model, 'gray'), 
                 linewidth=2, markersize=3, alpha=0.8,
@@ -282,7 +302,7 @@ def plot_model_comparison(videos, target_date, current_date, models=None):
     date_str = current_date.replace('-', '')
     filename = f"model_comparison_{date_str}.png"
     plt.savefig(filename, bbox_inches='tight')
-    plt.close()
+    plt.clf()
     
     return filename
 
@@ -298,8 +318,9 @@ def plot_combined_trend(actual_history, estimated_history, current_date,
     :param model_name: 估算模型名称
     """
     from config import CHART_FIGSIZE_HISTORY
+    plt = _pyplot()
     
-    plt.figure(figsize=CHART_FIGSIZE_HISTORY)
+    _get_figure(CHART_FIGSIZE_HISTORY)
     
     all_dates = []
     all_indices = []
@@ -366,7 +387,7 @@ def plot_combined_trend(actual_history, estimated_history, current_date,
     date_str = current_date.replace('-', '')
     filename = f"combined_trend_{model_name}_{date_str}.png"
     plt.savefig(filename, bbox_inches='tight', dpi=150)
-    plt.close()
+    plt.clf()
     
     return filename
 